@@ -11,6 +11,8 @@ class Game:
 		self.next_block = self.get_random_block()
 		self.game_over = False
 		self.score = 0
+		# Rendered score text, owned by the front end; cleared whenever the score changes
+		self.score_surface = None
 		self.rotate_sound = pygame.mixer.Sound("sound/Sounds_rotate.ogg")
 		self.clear_sound = pygame.mixer.Sound("sound/Sounds_clear.ogg")
 
@@ -25,6 +27,7 @@ class Game:
 		elif lines_cleared == 3:
 			self.score += 500
 		self.score += move_down_points
+		self.score_surface = None
 
 	def get_random_block(self):
 		if len(self.blocks) == 0:
@@ -68,6 +71,8 @@ class Game:
 		self.current_block = self.get_random_block()
 		self.next_block = self.get_random_block()
 		self.score = 0
+		self.score_surface = None
+		self.game_over = False
 
 	def block_fits(self):
 		tiles = self.current_block.get_cell_positions()
@@ -99,4 +104,7 @@ class Game:
 		elif self.next_block.id == 4:
 			self.next_block.draw(screen, 255, 280)
 		else:
-			self.next_block.draw(screen, 270, 270)
\ No newline at end of file
+			self.next_block.draw(screen, 270, 270)
+
+		return pygame.Rect(0, 0, 11 + self.grid.num_cols * self.grid.cell_size,
+			11 + self.grid.num_rows * self.grid.cell_size)
\ No newline at end of file
@@ -11,6 +11,19 @@ class Grid:
             for column in range(self.num_cols):
                 print(self.grid[row][column],end="")
             print()
+    def is_inside(self,row,column):
+        return 0<=row<self.num_rows and 0<=column<self.num_cols
+    def is_empty(self,row,column):
+        return self.grid[row][column]==0
+    def clear_full_rows(self):
+        # all() checks a whole row in C; rebuild the grid from the rows that survive
+        remaining=[row for row in self.grid if not all(row)]
+        completed=self.num_rows-len(remaining)
+        if completed>0:
+            self.grid=[[0]*self.num_cols for i in range(completed)]+remaining
+        return completed
+    def reset(self):
+        self.grid=[[0 for j in range (self.num_cols)] for i in range(self.num_rows)]
     def get_cell_colors(self):
 
         dark_grey=(26,31,40)
@@ -0,0 +1,75 @@
+import sys
+import pygame
+
+
+def debug_joystick():
+    # Print whatever the first controller reports, to help work out button/axis mappings
+    pygame.init()
+    pygame.joystick.init()
+
+    if pygame.joystick.get_count() == 0:
+        print("No joystick detected!")
+        return
+
+    joystick = pygame.joystick.Joystick(0)
+    joystick.init()
+
+    num_buttons = joystick.get_numbuttons()
+    num_axes = joystick.get_numaxes()
+    num_hats = joystick.get_numhats()
+
+    print("Joystick name:", joystick.get_name())
+    print("Number of buttons:", num_buttons)
+    print("Number of axes:", num_axes)
+    print("Number of hats:", num_hats)
+
+    print("\nPress any button or move a stick on the controller...\n")
+
+    # Device layout is fixed once enumerated, so look everything up once
+    get_button = joystick.get_button
+    get_axis = joystick.get_axis
+    get_hat = joystick.get_hat
+    button_range = range(num_buttons)
+    axis_range = range(num_axes)
+    hat_range = range(num_hats)
+
+    # Only report changes, so a held button prints once instead of every poll
+    prev_buttons = [False] * num_buttons
+    prev_axes = [0.0] * num_axes
+    prev_hats = [(0, 0)] * num_hats
+
+    clock = pygame.time.Clock()
+
+    while True:
+        pygame.event.pump()
+        lines = []
+
+        # Read each input kind in one pass; the common "nothing changed" case is a
+        # single list comparison instead of a Python-level check per input
+        buttons = [get_button(i) for i in button_range]
+        if buttons != prev_buttons:
+            for i in button_range:
+                if buttons[i] and not prev_buttons[i]:
+                    lines.append(f"Button {i} is pressed")
+            prev_buttons = buttons
+
+        axes = [round(get_axis(i), 2) for i in axis_range]
+        axes = [val if abs(val) > 0.2 else 0.0 for val in axes]
+        if axes != prev_axes:
+            for i in axis_range:
+                if axes[i] != prev_axes[i] and axes[i]:
+                    lines.append(f"Axis {i} moved: {axes[i]:.2f}")
+            prev_axes = axes
+
+        hats = [get_hat(i) for i in hat_range]
+        if hats != prev_hats:
+            for i in hat_range:
+                if hats[i] != prev_hats[i] and hats[i] != (0, 0):
+                    lines.append(f"Hat {i} moved: {hats[i]}")
+            prev_hats = hats
+
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+        clock.tick(60)
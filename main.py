@@ -1,7 +1,19 @@
-import pygame, sys
+import argparse
+import pygame, sys, math
 from game import Game
 from colors import Colors
 
+parser = argparse.ArgumentParser(description="Python Tetris")
+parser.add_argument("--levels", action="store_true", help="speed the game up every 500 points")
+parser.add_argument("--red-line", action="store_true", help="end the game once a block reaches the red line")
+parser.add_argument("--debug-joystick", action="store_true", help="print raw controller input instead of playing")
+args = parser.parse_args()
+
+if args.debug_joystick:
+    from joystick_util import debug_joystick
+    debug_joystick()
+    sys.exit()
+
 pygame.init()
 pygame.joystick.init()
 
@@ -23,17 +35,61 @@ next_rect = pygame.Rect(320, 215, 170, 180)
 
 screen = pygame.display.set_mode((500, 620))
 pygame.display.set_caption("Python Tetris")
-clock = pygame.time.Clock()
+
+# Text blitted every frame is converted to the display format once the window exists
+game_over_surface = title_font.render("GAME OVER", True, Colors.white).convert_alpha()
+restart_surface = small_font.render("Press any key to restart", True, Colors.white).convert_alpha()
+game_over_pos = game_over_surface.get_rect(center=(250, 270)).topleft
+restart_pos = restart_surface.get_rect(center=(250, 320)).topleft
 
 game = Game()
 
+
+def soft_drop():
+    game.move_down()
+    game.update_score(0, 1)
+
+
+# Input → action tables; game is reset in place, so the bound methods stay valid
+KEY_ACTIONS = {
+    pygame.K_LEFT: game.move_left,
+    pygame.K_RIGHT: game.move_right,
+    pygame.K_DOWN: soft_drop,
+    pygame.K_UP: game.rotate,
+}
+BUTTON_ACTIONS = {
+    0: game.rotate,
+    4: game.rotate,
+}
+
 GAME_UPDATE = pygame.USEREVENT
 pygame.time.set_timer(GAME_UPDATE, 200)
 
+# Only queue the events the loop handles; mouse motion and window chatter never reach Python
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN,
+                          pygame.VIDEOEXPOSE, GAME_UPDATE])
+
 last_move_time = 0
 move_delay = 150  # ms
 
 RED_LINE_Y = 40  # Y position of red line
+RED_LINE_ROWS = math.ceil((RED_LINE_Y + 5) / 30)  # grid rows that reach the line
+
+# Static labels, boxes and the optional red line are composited once into the background
+background = pygame.Surface((500, 620)).convert()
+background.fill(Colors.dark_blue)
+background.blit(score_surface, (365, 20, 50, 50))
+background.blit(next_surface, (375, 180, 50, 50))
+if args.red_line:
+    pygame.draw.line(background, (255, 0, 0), (0, RED_LINE_Y), (300, RED_LINE_Y), 3)
+pygame.draw.rect(background, Colors.light_blue, score_rect, 0, 10)
+pygame.draw.rect(background, Colors.light_blue, next_rect, 0, 10)
+
+# Translucent overlay shared by the level-up and game over screens
+overlay = pygame.Surface((500, 620)).convert()
+overlay.fill((0, 0, 0))
+overlay.set_alpha(180)
 
 # NEW → Level System Variables
 level = 1
@@ -41,138 +97,148 @@ level_threshold = 500  # points needed to level up
 level_up_time = 0
 show_level_up = False
 
+# Level text is only re-rendered when the level changes; Game caches the score text
+rendered_level = None
+
+# Push the whole window on the first frame and around overlays, dirty rects otherwise
+full_update = True
+
+# Sleep in event.wait() instead of spinning; redraw at most once per frame
+FRAME_MS = 1000 // 60
+next_frame_time = 0
+needs_redraw = True
+
 while True:
+    if needs_redraw:
+        first_event = pygame.event.wait(max(1, next_frame_time - pygame.time.get_ticks()))
+    else:
+        first_event = pygame.event.wait()
+    events = [first_event] + pygame.event.get()
+
+    # Sample the clock once, after all pending input is in hand
     current_time = pygame.time.get_ticks()
 
-    for event in pygame.event.get():
+    for event in events:
+        if event.type == pygame.NOEVENT:
+            continue
+        needs_redraw = True
+
         if event.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
 
+        # Parts of the window were uncovered, so the next frame pushes everything
+        if event.type == pygame.VIDEOEXPOSE:
+            full_update = True
+
         if event.type == pygame.KEYDOWN:
             if game.game_over:
-                game.game_over = False
                 game.reset()
                 level = 1
                 pygame.time.set_timer(GAME_UPDATE, 200)  # reset speed
             else:
-                if event.key == pygame.K_LEFT:
-                    game.move_left()
-                if event.key == pygame.K_RIGHT:
-                    game.move_right()
-                if event.key == pygame.K_DOWN:
-                    game.move_down()
-                if event.key == pygame.K_UP:
-                    game.rotate()
-
-        if joystick:
+                action = KEY_ACTIONS.get(event.key)
+                if action:
+                    action()
+
+        # Buttons act once per press rather than every frame they are held
+        if event.type == pygame.JOYBUTTONDOWN:
             if game.game_over:
                 # Press any button to restart
-                if any(joystick.get_button(i) for i in range(joystick.get_numbuttons())):
-                    game.game_over = False
-                    game.reset()
-                    level = 1
-                    pygame.time.set_timer(GAME_UPDATE, 200)
+                game.reset()
+                level = 1
+                pygame.time.set_timer(GAME_UPDATE, 200)
+            else:
+                action = BUTTON_ACTIONS.get(event.button)
+                if action:
+                    action()
+
+        # Both sticks move the piece; SDL only reports axes when they change
+        if event.type == pygame.JOYAXISMOTION and not game.game_over:
+            if current_time - last_move_time > move_delay:
+                if event.axis in (0, 2):
+                    if event.value < -0.5:
+                        game.move_left()
+                        last_move_time = current_time
+                    elif event.value > 0.5:
+                        game.move_right()
+                        last_move_time = current_time
+                elif event.axis in (1, 3):
+                    if event.value > 0.5:
+                        soft_drop()
+                        last_move_time = current_time
 
         if event.type == GAME_UPDATE and not game.game_over:
             game.move_down()
 
-    # Controller Handling
-    if joystick and not game.game_over:
-        pygame.event.pump()
-        axis_x1 = joystick.get_axis(0)
-        axis_y1 = joystick.get_axis(1)
-        axis_x2 = joystick.get_axis(2)
-        axis_y2 = joystick.get_axis(3)
-
-        if current_time - last_move_time > move_delay:
-            if axis_x1 < -0.5:
-                game.move_left()
-                last_move_time = current_time
-            elif axis_x1 > 0.5:
-                game.move_right()
-                last_move_time = current_time
-            if axis_y1 > 0.5:
-                game.move_down()
-                last_move_time = current_time
-            if axis_x2 < -0.5:
-                game.move_left()
-                last_move_time = current_time
-            elif axis_x2 > 0.5:
-                game.move_right()
-                last_move_time = current_time
-            if axis_y2 > 0.5:
-                game.move_down()
-                last_move_time = current_time
-
-        if any(joystick.get_button(i) for i in [4]):
-            game.rotate()
-
     # Game Over Check (block crosses red line)
-    if not game.game_over:
-        for row in range(len(game.grid.grid)):
-            for col in range(len(game.grid.grid[row])):
-                if game.grid.grid[row][col] != 0:
-                    block_y = row * 30  # adjust block size if needed
-                    if block_y < RED_LINE_Y + 5:
-                        game.game_over = True
-                        break
-            if game.game_over:
-                break
+    # Only the rows above the line can cross it, so skip the rest of the grid
+    if args.red_line and not game.game_over:
+        if any(any(row) for row in game.grid.grid[:RED_LINE_ROWS]):
+            game.game_over = True
+
+    # Nothing falls behind the game-over screen, so stop the timer waking the loop;
+    # the restart paths above arm it again
+    if game.game_over:
+        pygame.time.set_timer(GAME_UPDATE, 0)
 
     # 🟢 LEVEL UP CHECK
-    if not game.game_over and game.score >= level * level_threshold:
+    if args.levels and not game.game_over and game.score >= level * level_threshold:
         level += 1
         show_level_up = True
-        level_up_time = pygame.time.get_ticks()
+        level_up_time = current_time
 
         # Speed up the game
         new_speed = max(50, 200 - (level - 1) * 30)  # Minimum delay = 50ms
         pygame.time.set_timer(GAME_UPDATE, new_speed)
 
-    # Drawing
-    score_value_surface = title_font.render(str(game.score), True, Colors.white)
-    level_surface = small_font.render(f"Level: {level}", True, Colors.white)  # NEW
-
-    screen.fill(Colors.dark_blue)
-    screen.blit(score_surface, (365, 20, 50, 50))
-    screen.blit(next_surface, (375, 180, 50, 50))
-    screen.blit(level_surface, (365, 120))  # NEW
-
-    # Red line
-    pygame.draw.line(screen, (255, 0, 0), (0, RED_LINE_Y), (300, RED_LINE_Y), 3)
-
-    pygame.draw.rect(screen, Colors.light_blue, score_rect, 0, 10)
-    screen.blit(score_value_surface, score_value_surface.get_rect(centerx=score_rect.centerx, centery=score_rect.centery))
-    pygame.draw.rect(screen, Colors.light_blue, next_rect, 0, 10)
+    if show_level_up:
+        needs_redraw = True
+    if not needs_redraw or current_time < next_frame_time:
+        continue
+    next_frame_time = current_time + FRAME_MS
 
-    game.draw(screen)
+    # Drawing
+    # Centred positions are worked out when the text changes, not on every blit
+    if game.score_surface is None:
+        game.score_surface = title_font.render(str(game.score), True, Colors.white).convert_alpha()
+        score_pos = game.score_surface.get_rect(center=score_rect.center).topleft
+    if level != rendered_level:
+        level_surface = small_font.render(f"Level: {level}", True, Colors.white).convert_alpha()  # NEW
+        level_up_surface = title_font.render(f"LEVEL {level}!", True, Colors.white).convert_alpha()
+        level_up_pos = level_up_surface.get_rect(center=(250, 300)).topleft
+        rendered_level = level
+
+    overlay_drawn = show_level_up or game.game_over
+    dirty = [score_rect, next_rect]
+
+    screen.blit(background, (0, 0))
+    if args.levels:
+        dirty.append(screen.blit(level_surface, (365, 120)))  # NEW
+    screen.blit(game.score_surface, score_pos)
+
+    dirty.append(game.draw(screen))
 
     # 🟢 SHOW LEVEL UP OVERLAY FOR 2 SECONDS
     if show_level_up:
-        overlay = pygame.Surface((500, 620))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
 
-        level_up_surface = title_font.render(f"LEVEL {level}!", True, Colors.white)
-        screen.blit(level_up_surface, level_up_surface.get_rect(center=(250, 300)))
+        screen.blit(level_up_surface, level_up_pos)
 
-        if pygame.time.get_ticks() - level_up_time > 2000:
+        if current_time - level_up_time > 2000:
             show_level_up = False
 
     # Game Over Screen
     if game.game_over:
-        overlay = pygame.Surface((500, 620))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
         screen.blit(overlay, (0, 0))
 
-        game_over_surface = title_font.render("GAME OVER", True, Colors.white)
-        restart_surface = small_font.render("Press any key to restart", True, Colors.white)
-
-        screen.blit(game_over_surface, game_over_surface.get_rect(center=(250, 270)))
-        screen.blit(restart_surface, restart_surface.get_rect(center=(250, 320)))
+        screen.blit(game_over_surface, game_over_pos)
+        screen.blit(restart_surface, restart_pos)
 
-    pygame.display.update()
-    clock.tick(60)
+    if full_update or overlay_drawn:
+        pygame.display.update()
+    else:
+        pygame.display.update(dirty)
+    full_update = overlay_drawn
+    # Keep drawing while the level-up overlay counts down, and once more after any overlay
+    needs_redraw = show_level_up or (full_update and not game.game_over)
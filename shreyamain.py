@@ -1,9 +1,11 @@
+import atexit
 import os
 import sys
 import random
 import math
 import time
-from typing import List, Tuple, Optional, Dict, Union
+from collections import deque
+from typing import Callable, List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 import pygame
 
@@ -13,6 +15,7 @@ import pygame
 # pylint: disable=no-member
 pygame.mixer.pre_init(44100, -16, 2, 512)
 pygame.init()
+atexit.register(pygame.quit)
 pygame.font.init()
 pygame.joystick.init()
 
@@ -43,6 +46,20 @@ VIBRANT_PASTELS = [
 ]
 
 FPS = 60
+# SCALED presents the window through SDL's GPU renderer (and scales it on hi-dpi screens).
+# The renderer uploads and presents the whole window every frame, so there is no
+# per-rect display update; draw() only limits which background areas get re-blitted
+DISPLAY_FLAGS = pygame.SCALED
+# gameplay advances in fixed steps at SIM_HZ, independent of how often a frame is drawn
+SIM_HZ = 240
+SIM_STEP_MS = 1000 / SIM_HZ
+MAX_CATCH_UP_MS = 250
+# while the game-over screen is up the loop blocks in event.wait for at most this long
+GAME_OVER_WAIT_MS = 100
+# sleeps are shortened by the mean oversleep of the last PACING_WINDOW sleeps, and the
+# final SPIN_MARGIN_S before a frame deadline is busy-waited for sub-millisecond wake-ups
+PACING_WINDOW = 2 * FPS
+SPIN_MARGIN_S = 0.001
 BLOCKS_PER_STAGE = 5
 MAX_STAGE = 3
 STAGE_SPEEDS = [0.7, 0.5, 0.3, 0.18]  # seconds per step
@@ -62,6 +79,9 @@ PREVIEW_ANIMATION_MAX_OFFSET = 2
 PREVIEW_GLOW_BASE_ALPHA = 50
 PREVIEW_GLOW_PULSE_MAGNITUDE = 30
 PREVIEW_GLOW_PULSE_SPEED = 0.005
+# one sine period in 256 steps; radians * SIN_LUT_SCALE gives the index (wrap with & 0xFF)
+SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+SIN_LUT_SCALE = 256 / (2 * math.pi)
 PREVIEW_HIGHLIGHT_BRIGHTNESS = 50
 PREVIEW_HIGHLIGHT_ALPHA = 100
 PREVIEW_HIGHLIGHT_BORDER_RADIUS = 2
@@ -72,12 +92,15 @@ GAME_OVER_DELAY_MS = 50
 STAGE_TRANSITION_FRAMES = 60
 PIECE_PADDING = 2
 GHOST_PADDING = 4
+SCREEN_RECT = pygame.Rect(0, 0, FULL_WIDTH, SCREEN_HEIGHT)
+PLAYFIELD_RECT = pygame.Rect(0, 0, GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE)
+PREVIEW_REGION_RECT = pygame.Rect(SCREEN_WIDTH, 0, SIDEBAR_WIDTH, INFO_BOX_Y)
+SIDEBAR_INFO_RECT = pygame.Rect(SCREEN_WIDTH, INFO_BOX_Y, SIDEBAR_WIDTH, 3 * SIDEBAR_ITEM_SPACING)
 
 FONT_SMALL = pygame.font.SysFont('Arial', 18)
 FONT_LARGE = pygame.font.SysFont('Arial', 36, bold=True)
 
 # Starfield settings
-STAR_SPAWN_CHANCE = 0.05
 STAR_COUNT = 30
 STAR_RADIUS_SMALL = 1
 STAR_RADIUS_MEDIUM = 2
@@ -85,7 +108,7 @@ STAR_COLORS = [(255, 255, 255), (255, 240, 255), (220, 255, 255)]
 STAR_TRAIL_LENGTH = 3
 STAR_MIN_SPEED = 6
 STAR_MAX_SPEED = 10
-STAR_LIFESPAN_FRAMES = 20
+STAR_SCROLL_SPEED = STAR_MIN_SPEED
 
 # Particles
 PARTICLE_EFFECTS = {
@@ -110,20 +133,55 @@ SHAPES = [
     [[1, 1, 0], [0, 1, 1]]   # Z
 ]
 
+# Bitboard rows: bit (x + BOARD_PAD) is column x, with solid walls either side
+BOARD_PAD = 4
+FULL_ROW = (1 << (GRID_WIDTH + 2 * BOARD_PAD)) - 1
+EMPTY_ROW = FULL_ROW & ~(((1 << GRID_WIDTH) - 1) << BOARD_PAD)
+
+def _shape_bits(shape: Tuple[Tuple[int, ...], ...]) -> Tuple[int, ...]:
+    # one int per shape row, bit c set for a filled cell in column c
+    return tuple(sum(1 << x_offset for x_offset, val in enumerate(row) if val) for row in shape)
+
+def _rotations_of(shape: List[List[int]]) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    # the four clockwise rotation states (O repeats itself, which keeps rot & 3 uniform)
+    states = [tuple(tuple(row) for row in shape)]
+    for _ in range(3):
+        states.append(tuple(zip(*states[-1][::-1])))
+    return tuple(states)
+
+# ROTATIONS[shape_id][rot] is the cell table, PIECE_BITS[shape_id][rot] its bitboard rows
+ROTATIONS = tuple(_rotations_of(shape) for shape in SHAPES)
+PIECE_BITS = tuple(tuple(_shape_bits(state) for state in states) for states in ROTATIONS)
+
+def _column_bottoms(shape: Tuple[Tuple[int, ...], ...]) -> Tuple[Tuple[int, int], ...]:
+    # (column, lowest filled row) for every column the shape occupies
+    return tuple((x_offset, max(y_offset for y_offset, row in enumerate(shape) if row[x_offset]))
+                 for x_offset in range(len(shape[0])) if any(row[x_offset] for row in shape))
+
+PIECE_BOTTOMS = tuple(tuple(_column_bottoms(state) for state in states) for states in ROTATIONS)
+
 # Controller constants
 AXIS_THRESHOLD = 0.3
-MOVEMENT_COOLDOWN_MS = 130
+# held keys: first repeat after DAS_DELAY_MS, then one step every ARR_MS; soft drop repeats on its own timer
+DAS_DELAY_MS = 170
+ARR_MS = 50
+SOFT_DROP_MS = 50
 
 # -------------------------
 # Data classes
 # -------------------------
 @dataclass
 class Tetromino:
-    shape: List[List[int]]
+    shape_id: int
+    rot: int
     color: Tuple[int, int, int]
     x: int
     y: int
 
+    @property
+    def shape(self) -> Tuple[Tuple[int, ...], ...]:
+        return ROTATIONS[self.shape_id][self.rot]
+
 @dataclass
 class GameStateData:
     score: int = 0
@@ -140,7 +198,6 @@ class StageInfo:
 
 @dataclass
 class VisualEffects:
-    stars: List['ShootingStar'] = field(default_factory=list)
     particles: List['Particle'] = field(default_factory=list)
 
 # -------------------------
@@ -239,129 +296,257 @@ class SoundManager:
             print("Error stopping music:", err)
 
 # -------------------------
-# Particles + Stars
+# Particles
 # -------------------------
 class Particle:
+    # many short-lived instances: slots keep them small and attribute access cheap
+    __slots__ = ("x", "y", "color", "size", "vx", "vy", "life", "alpha", "glow_size")
+
     def __init__(self, x: float, y: float, color: Tuple[int, int, int]) -> None:
         self.x = x
         self.y = y
         self.color = color
         self.size = random.randint(PARTICLE_EFFECTS["min_size"], PARTICLE_EFFECTS["max_size"])
-        self.speed = random.uniform(PARTICLE_EFFECTS["min_speed"], PARTICLE_EFFECTS["max_speed"])
-        self.angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(PARTICLE_EFFECTS["min_speed"], PARTICLE_EFFECTS["max_speed"])
+        angle = random.uniform(0, 2 * math.pi)
+        # direction and speed never change, so store the per-frame velocity
+        self.vx = math.cos(angle) * speed
+        self.vy = math.sin(angle) * speed
         self.life = random.randint(PARTICLE_EFFECTS["min_life"], PARTICLE_EFFECTS["max_life"])
         self.alpha = 255.0
         self.glow_size = self.size * 2.0
 
-    def update(self) -> None:
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
+    def update_and_alive(self) -> bool:
+        self.x += self.vx
+        self.y += self.vy
         self.life -= 1
         self.size = max(0, self.size - PARTICLE_EFFECTS["shrink_rate"])
         self.glow_size = max(0, self.glow_size - PARTICLE_EFFECTS["glow_shrink_rate"])
         self.alpha = max(0, self.alpha - PARTICLE_EFFECTS["fade_rate"])
+        return self.life > 0 and self.alpha > 0
 
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.life > 0:
-            self._draw_glow(surface)
-            self._draw_core(surface)
-
-    def _create_alpha_surface(self, size: int) -> pygame.Surface:
-        return pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-
-    def _draw_glow(self, surface: pygame.Surface) -> None:
+    def sprites(self, renderer: "TetrisRenderer") -> List[Tuple[pygame.Surface, Tuple[float, float]]]:
+        # glow then core, as (surface, pos) pairs ready for Surface.blits()
+        if self.life <= 0:
+            return []
         glow_alpha = min(PARTICLE_EFFECTS["glow_alpha"], self.alpha)
-        glow_color = (*self.color, int(glow_alpha))
-        glow_surf = self._create_alpha_surface(int(self.glow_size))
-        pygame.draw.circle(glow_surf, glow_color, (int(self.glow_size), int(self.glow_size)), int(self.glow_size))
-        surface.blit(glow_surf, (self.x - self.glow_size, self.y - self.glow_size))
-
-    def _draw_core(self, surface: pygame.Surface) -> None:
-        particle_color = (*self.color, int(self.alpha))
-        core_surf = self._create_alpha_surface(int(self.size))
-        pygame.draw.circle(core_surf, particle_color, (int(self.size), int(self.size)), int(self.size))
-        surface.blit(core_surf, (self.x - self.size, self.y - self.size))
-
-class ShootingStar:
-    def __init__(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
-        self.x = float(x)
-        self.y = float(y)
-        self.color = color
-        self.life = STAR_LIFESPAN_FRAMES
-        self.dx = random.uniform(-2, 2)
-        self.dy = random.uniform(STAR_MIN_SPEED, STAR_MAX_SPEED)
-
-    def update(self) -> None:
-        self.x += self.dx
-        self.y += self.dy
-        self.life -= 1
-
-    def draw(self, surface: pygame.Surface) -> None:
-        if self.life > 0:
-            start_pos = (int(self.x), int(self.y))
-            end_pos = (int(self.x - self.dx * STAR_TRAIL_LENGTH), int(self.y - self.dy * STAR_TRAIL_LENGTH))
-            pygame.draw.line(surface, self.color, start_pos, end_pos, 2)
+        pairs = []
+        for sprite in (renderer.particle_sprite(self.color, self.glow_size, glow_alpha),
+                       renderer.particle_sprite(self.color, self.size, self.alpha)):
+            if sprite is not None:
+                half = sprite.get_width() // 2
+                pairs.append((sprite, (self.x - half, self.y - half)))
+        return pairs
+
+    def rect(self) -> pygame.Rect:
+        radius = max(self.size, self.glow_size)
+        return pygame.Rect(int(self.x - radius) - 1, int(self.y - radius) - 1, int(radius * 2) + 3, int(radius * 2) + 3)
 
 # -------------------------
 # Renderer (visuals & UI)
 # -------------------------
+def _gradient_colors(height: int) -> List[Tuple[int, int, int]]:
+    colors = []
+    for y_pos in range(height):
+        red = 20 + int(20 + 40 * math.sin(y_pos * 0.02))
+        green = 20 + int(20 + 50 * math.sin(y_pos * 0.015 + 1))
+        blue = 50 + int(50 + 50 * math.sin(y_pos * 0.01 + 2))
+        colors.append((max(0, min(red, 255)), max(0, min(green, 255)), max(0, min(blue, 255))))
+    return colors
+
 class TetrisRenderer:
     def __init__(self):
         self.preview_animation_offset = 0.0
         self.preview_animation_direction = 1
+        self._preview_count = 0
+        self.draw_next_pieces = self._draw_no_previews
+        self.set_stage(0)
+        # built by build_caches(), once a display mode exists for convert()
+        self._bg_cache: Optional[pygame.Surface] = None
+        self._block_surfs: List[pygame.Surface] = []
+        self._ghost_cell: Optional[pygame.Surface] = None
+        self._preview_box_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._highlight_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # whole-piece sprites keyed by (shape_id, rot, colour, style)
+        self._piece_sprites: Dict[Tuple[int, int, Tuple[int, int, int], str], pygame.Surface] = {}
+        self._game_over_layer: Optional[pygame.Surface] = None
+        self._star_layer: Optional[pygame.Surface] = None
+        self._star_offset = 0
+        self._particle_cache: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+        # every string the sidebar shows is composed from these, so nothing is rendered per frame
+        self._glyphs: Dict[str, pygame.Surface] = {}
+        self._stage_labels: List[pygame.Surface] = []
+        self._sidebar_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._sidebar_key: Optional[Tuple[int, int, int]] = None
+
+    def build_caches(self) -> None:
+        # everything static is rendered up front so no frame pays for a first-use build
+        self._bg_cache = self._render_galaxy_background()
+        self._star_layer = self._render_star_layer()
+        self._build_grid_sprites()
+        self._build_text_atlas()
+        self._game_over_layer = self._render_game_over()
 
     def draw_galaxy_background(self, surface: pygame.Surface) -> None:
-        # vertical gradient like the earlier code
-        for y_pos in range(SCREEN_HEIGHT):
-            red = 20 + int(20 + 40 * math.sin(y_pos * 0.02))
-            green = 20 + int(20 + 50 * math.sin(y_pos * 0.015 + 1))
-            blue = 50 + int(50 + 50 * math.sin(y_pos * 0.01 + 2))
-            color = (max(0, min(red, 255)), max(0, min(green, 255)), max(0, min(blue, 255)))
-            surface.fill(color, (0, y_pos, FULL_WIDTH, 1))
+        surface.blit(self._bg_cache, (0, 0))
+
+    def restore_background(self, surface: pygame.Surface, rects: List[pygame.Rect]) -> None:
+        # copy the cached background back only under the given screen rects
+        background = self._bg_cache
+        surface.blits([(background, rect, rect) for rect in rects], doreturn=False)
+
+    def _render_galaxy_background(self) -> pygame.Surface:
+        # vertical gradient like the earlier code: it only varies with y, so paint a
+        # single 1px column and let transform.scale stretch it across the width
+        column = pygame.Surface((1, SCREEN_HEIGHT))
+        for y_pos, color in enumerate(_gradient_colors(SCREEN_HEIGHT)):
+            column.set_at((0, y_pos), color)
+        background = pygame.transform.scale(column, (FULL_WIDTH, SCREEN_HEIGHT)).convert()
         # sprinkle a few static stars (random)
         for _ in range(STAR_COUNT):
             x_pos = random.randint(0, FULL_WIDTH)
             y_pos = random.randint(0, SCREEN_HEIGHT)
             radius = random.choice([STAR_RADIUS_SMALL, STAR_RADIUS_MEDIUM])
             color = random.choice(STAR_COLORS)
-            pygame.draw.circle(surface, color, (x_pos, y_pos), radius)
-
-    def draw_grid(self, surface: pygame.Surface, grid: List[List[Union[int, Tuple[int, int, int]]]]) -> None:
-        for y_pos, row in enumerate(grid):
-            for x_pos, cell in enumerate(row):
+            pygame.draw.circle(background, color, (x_pos, y_pos), radius)
+        # the grid lines never move, so they are part of the background too
+        for y_pos in range(GRID_HEIGHT):
+            for x_pos in range(GRID_WIDTH):
                 rect = pygame.Rect(x_pos * GRID_SIZE, y_pos * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                if cell and isinstance(cell, tuple):
-                    pygame.draw.rect(surface, cell, rect.inflate(-PIECE_PADDING, -PIECE_PADDING))
-                pygame.draw.rect(surface, GRID_LINE_COLOR, rect, 1)
+                pygame.draw.rect(background, GRID_LINE_COLOR, rect, 1)
+        return background
+
+    def draw_star_layer(self, surface: pygame.Surface) -> None:
+        # shooting-star streaks live on one pre-drawn texture that scrolls down the playfield
+        self._star_offset = (self._star_offset + STAR_SCROLL_SPEED) % SCREEN_HEIGHT
+        surface.blit(self._star_layer, (0, self._star_offset - SCREEN_HEIGHT))
+
+    def _render_star_layer(self) -> pygame.Surface:
+        # two stacked copies of one wrapping tile, so a single blit always covers the screen
+        width = PLAYFIELD_RECT.width
+        tile = pygame.Surface((width, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for _ in range(STAR_COUNT):
+            x_pos = random.uniform(0, width)
+            y_pos = random.uniform(0, SCREEN_HEIGHT)
+            dx = random.uniform(-2, 2)
+            dy = random.uniform(STAR_MIN_SPEED, STAR_MAX_SPEED)
+            color = random.choice(STAR_COLORS)
+            for wrap in (0, SCREEN_HEIGHT):
+                start_pos = (int(x_pos), int(y_pos + wrap))
+                end_pos = (int(x_pos - dx * STAR_TRAIL_LENGTH), int(y_pos + wrap - dy * STAR_TRAIL_LENGTH))
+                pygame.draw.line(tile, color, start_pos, end_pos, 2)
+        layer = pygame.Surface((width, SCREEN_HEIGHT * 2), pygame.SRCALPHA)
+        layer.blit(tile, (0, 0))
+        layer.blit(tile, (0, SCREEN_HEIGHT))
+        return layer.convert_alpha()
+
+    def _build_grid_sprites(self) -> None:
+        # one padded block per palette colour, plus the ghost outline
+        block_size = GRID_SIZE - PIECE_PADDING
+        self._block_surfs = []
+        for color in VIBRANT_PASTELS:
+            block = pygame.Surface((block_size, block_size)).convert()
+            block.fill(color)
+            self._block_surfs.append(block)
+        ghost_cell = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+        pygame.draw.rect(ghost_cell, (*TEXT_COLOR, GHOST_ALPHA), ghost_cell.get_rect(), PREVIEW_BOX_BORDER_WIDTH)
+        self._ghost_cell = ghost_cell.convert_alpha()
+
+    def draw_grid(self, surface: pygame.Surface, grid: List[List[int]], rows: List[int]) -> None:
+        # the bitboard says which rows are empty, so those are skipped without walking their cells
+        block_surfs = self._block_surfs
+        offset = PIECE_PADDING // 2
+        blits = [(block_surfs[cell - 1], (x_pos * GRID_SIZE + offset, y_pos * GRID_SIZE + offset))
+                 for y_pos, row in enumerate(grid) if rows[y_pos] != EMPTY_ROW
+                 for x_pos, cell in enumerate(row) if cell]
+        surface.blits(blits, doreturn=False)
+
+    def particle_sprite(self, color: Tuple[int, int, int], radius: float, alpha: float) -> Optional[pygame.Surface]:
+        # radius snapped to 2px steps and alpha to 16 levels keeps the cache small
+        radius_q = (int(radius) + 1) // 2 * 2
+        alpha_q = int(alpha) >> 4
+        if radius_q <= 0 or alpha_q <= 0:
+            return None
+        key = (color, radius_q, alpha_q)
+        sprite = self._particle_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius_q * 2, radius_q * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha_q * 17), (radius_q, radius_q), radius_q)
+            sprite = sprite.convert_alpha()
+            self._particle_cache[key] = sprite
+        return sprite
 
     def draw_piece(self, surface: pygame.Surface, piece: Tetromino, is_ghost: bool = False) -> None:
-        for y_offset, row in enumerate(piece.shape):
-            for x_offset, val in enumerate(row):
-                if val:
-                    self._draw_block(surface, piece, x_offset, y_offset, is_ghost)
-
-    def _draw_block(self, surface: pygame.Surface, piece: Tetromino, x_offset: int, y_offset: int, is_ghost: bool) -> None:
-        rect = pygame.Rect((piece.x + x_offset) * GRID_SIZE, (piece.y + y_offset) * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-        if is_ghost:
-            ghost_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-            pygame.draw.rect(ghost_surface, (*TEXT_COLOR, GHOST_ALPHA), ghost_surface.get_rect(), PREVIEW_BOX_BORDER_WIDTH)
-            surface.blit(ghost_surface, rect.topleft)
+        sprite = self._piece_sprite(piece, "ghost" if is_ghost else "block")
+        surface.blit(sprite, (piece.x * GRID_SIZE, piece.y * GRID_SIZE))
+
+    def _piece_sprite(self, piece: Tetromino, style: str) -> pygame.Surface:
+        key = (piece.shape_id, piece.rot, piece.color, style)
+        sprite = self._piece_sprites.get(key)
+        if sprite is None:
+            sprite = self._render_piece(piece.shape, piece.color, style)
+            self._piece_sprites[key] = sprite
+        return sprite
+
+    def _render_piece(self, shape: Tuple[Tuple[int, ...], ...], color: Tuple[int, int, int], style: str) -> pygame.Surface:
+        # lay the piece's cells out once on a transparent surface; later frames blit it whole
+        if style == "ghost":
+            layers = [(self._ghost_cell, 0)]
         else:
-            pygame.draw.rect(surface, piece.color, rect.inflate(-PIECE_PADDING, -PIECE_PADDING))
+            layers = [(self._block_surfs[VIBRANT_PASTELS.index(color)], PIECE_PADDING // 2)]
+            if style == "preview":
+                layers.append((self._highlight_sprite(color), GHOST_PADDING // 2))
+        sprite = pygame.Surface((len(shape[0]) * GRID_SIZE, len(shape) * GRID_SIZE), pygame.SRCALPHA)
+        sprite.blits([(cell, (x_offset * GRID_SIZE + offset, y_offset * GRID_SIZE + offset))
+                      for y_offset, row in enumerate(shape) for x_offset, val in enumerate(row) if val
+                      for cell, offset in layers], doreturn=False)
+        return sprite.convert_alpha()
 
     def draw_sidebar(self, surface: pygame.Surface, score: int, lines: int, stage: int) -> None:
-        info = [f"Score: {score}", f"Lines: {lines}", f"Stage: {STAGE_NAMES[stage]}"]
-        for i, text in enumerate(info):
-            txt_img = FONT_SMALL.render(text, True, TEXT_COLOR)
-            surface.blit(txt_img, (SCREEN_WIDTH + 20, INFO_BOX_Y + i * SIDEBAR_ITEM_SPACING))
-
-    def draw_next_pieces(self, surface: pygame.Surface, next_pieces: List[Tetromino], stage: int) -> None:
-        preview_count = PREVIEW_COUNTS[stage]
-        if not preview_count:
-            return
+        key = (score, lines, stage)
+        if key != self._sidebar_key:
+            self._sidebar_blits = self._compose_sidebar(score, lines, stage)
+            self._sidebar_key = key
+        surface.blits(self._sidebar_blits, doreturn=False)
+
+    def _build_text_atlas(self) -> None:
+        glyphs = {text: FONT_SMALL.render(text, True, TEXT_COLOR).convert_alpha()
+                  for text in ("Score: ", "Lines: ", "Stage: ", "Next Pieces:")}
+        for digit in "0123456789":
+            glyphs[digit] = FONT_SMALL.render(digit, True, TEXT_COLOR).convert_alpha()
+        self._glyphs = glyphs
+        self._stage_labels = [FONT_SMALL.render(name, True, TEXT_COLOR).convert_alpha() for name in STAGE_NAMES]
+
+    def _compose_sidebar(self, score: int, lines: int, stage: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        # label then its value, digit by digit, laid out once per (score, lines, stage)
+        glyphs = self._glyphs
+        blits = []
+        rows = [
+            [glyphs["Score: "]] + [glyphs[digit] for digit in str(score)],
+            [glyphs["Lines: "]] + [glyphs[digit] for digit in str(lines)],
+            [glyphs["Stage: "], self._stage_labels[stage]],
+        ]
+        for i, parts in enumerate(rows):
+            x_pos = SCREEN_WIDTH + 20
+            y_pos = INFO_BOX_Y + i * SIDEBAR_ITEM_SPACING
+            for part in parts:
+                blits.append((part, (x_pos, y_pos)))
+                x_pos += part.get_width()
+        return blits
+
+    def set_stage(self, stage: int) -> None:
+        # pick the preview path once per stage change rather than testing the count every frame
+        self._preview_count = PREVIEW_COUNTS[stage]
+        self.draw_next_pieces = self._draw_previews_active if self._preview_count else self._draw_no_previews
+
+    def _draw_no_previews(self, surface: pygame.Surface, next_pieces: List[Tetromino]) -> None:
+        pass
+
+    def _draw_previews_active(self, surface: pygame.Surface, next_pieces: List[Tetromino]) -> None:
+        # everything here stays inside PREVIEW_REGION_RECT, which the game restores every frame
+        preview_count = self._preview_count
         self._update_preview_animation()
-        title = FONT_SMALL.render("Next Pieces:", True, TEXT_COLOR)
-        surface.blit(title, (PREVIEW_BOX_X, PREVIEW_BOX_Y - TEXT_OFFSET))
+        surface.blit(self._glyphs["Next Pieces:"], (PREVIEW_BOX_X, PREVIEW_BOX_Y - TEXT_OFFSET))
         for i in range(preview_count):
             if i < len(next_pieces):
                 self._draw_single_preview(surface, next_pieces[i], i)
@@ -380,14 +565,20 @@ class TetrisRenderer:
 
     def _draw_preview_box(self, surface: pygame.Surface, rect: pygame.Rect, index: int) -> None:
         time_ticks = pygame.time.get_ticks()
-        pulse = math.sin(time_ticks * PREVIEW_GLOW_PULSE_SPEED + index)
+        pulse = SIN_LUT[int((time_ticks * PREVIEW_GLOW_PULSE_SPEED + index) * SIN_LUT_SCALE) & 0xFF]
         glow_alpha = (PREVIEW_GLOW_BASE_ALPHA + int(PREVIEW_GLOW_PULSE_MAGNITUDE * pulse))
-        border_surf = pygame.Surface(rect.size, pygame.SRCALPHA)
         color_index = index % len(VIBRANT_PASTELS)
-        border_color = (*VIBRANT_PASTELS[color_index], max(10, glow_alpha))
-        pygame.draw.rect(border_surf, border_color, border_surf.get_rect(), border_radius=PREVIEW_BOX_BORDER_RADIUS)
-        outline_color = (255, 255, 255, max(6, glow_alpha // 2))
-        pygame.draw.rect(border_surf, outline_color, border_surf.get_rect(), PREVIEW_BOX_BORDER_WIDTH, border_radius=PREVIEW_BOX_BORDER_RADIUS)
+        # the box size is fixed, so one converted surface per (colour, alpha) pulse step
+        key = (color_index, glow_alpha)
+        border_surf = self._preview_box_cache.get(key)
+        if border_surf is None:
+            border_surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+            border_color = (*VIBRANT_PASTELS[color_index], max(10, glow_alpha))
+            pygame.draw.rect(border_surf, border_color, border_surf.get_rect(), border_radius=PREVIEW_BOX_BORDER_RADIUS)
+            outline_color = (255, 255, 255, max(6, glow_alpha // 2))
+            pygame.draw.rect(border_surf, outline_color, border_surf.get_rect(), PREVIEW_BOX_BORDER_WIDTH, border_radius=PREVIEW_BOX_BORDER_RADIUS)
+            border_surf = border_surf.convert_alpha()
+            self._preview_box_cache[key] = border_surf
         surface.blit(border_surf, rect.topleft)
 
     def _draw_preview_piece(self, surface: pygame.Surface, piece: Tetromino, box_y: int) -> None:
@@ -395,33 +586,36 @@ class TetrisRenderer:
         max_height = len(piece.shape)
         x_start = (PREVIEW_BOX_X + (PREVIEW_PIECE_AREA_SIZE - max_width) * GRID_SIZE // 2)
         y_start = (box_y + (PREVIEW_PIECE_AREA_SIZE - max_height) * GRID_SIZE // 2)
-        for y_offset, row in enumerate(piece.shape):
-            for x_offset, val in enumerate(row):
-                if val:
-                    rect = pygame.Rect(x_start + x_offset * GRID_SIZE, y_start + y_offset * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                    pygame.draw.rect(surface, piece.color, rect.inflate(-PIECE_PADDING, -PIECE_PADDING))
-                    self._draw_piece_highlight(surface, rect, piece.color)
-
-    def _draw_piece_highlight(self, surface: pygame.Surface, rect: pygame.Rect, color: tuple) -> None:
-        highlight_color = tuple(min(c + PREVIEW_HIGHLIGHT_BRIGHTNESS, 255) for c in color)
-        highlight_alpha_color = (*highlight_color, PREVIEW_HIGHLIGHT_ALPHA)
-        highlight_rect = rect.inflate(-GHOST_PADDING, -GHOST_PADDING)
-        highlight_rect.height //= 2
-        # draw highlight with alpha
-        highlight_surf = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(highlight_surf, highlight_alpha_color, highlight_surf.get_rect(), border_radius=PREVIEW_HIGHLIGHT_BORDER_RADIUS)
-        surface.blit(highlight_surf, (highlight_rect.x, highlight_rect.y))
+        surface.blit(self._piece_sprite(piece, "preview"), (x_start, y_start))
+
+    def _highlight_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        # top-half highlight with alpha, one converted surface per piece colour
+        highlight_surf = self._highlight_cache.get(color)
+        if highlight_surf is None:
+            highlight_rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE).inflate(-GHOST_PADDING, -GHOST_PADDING)
+            highlight_rect.height //= 2
+            highlight_color = tuple(min(c + PREVIEW_HIGHLIGHT_BRIGHTNESS, 255) for c in color)
+            highlight_alpha_color = (*highlight_color, PREVIEW_HIGHLIGHT_ALPHA)
+            highlight_surf = pygame.Surface(highlight_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(highlight_surf, highlight_alpha_color, highlight_surf.get_rect(), border_radius=PREVIEW_HIGHLIGHT_BORDER_RADIUS)
+            highlight_surf = highlight_surf.convert_alpha()
+            self._highlight_cache[color] = highlight_surf
+        return highlight_surf
 
     def draw_game_over(self, surface: pygame.Surface) -> None:
+        surface.blit(self._game_over_layer, (0, 0))
+
+    def _render_game_over(self) -> pygame.Surface:
+        # the dimmed overlay and both lines of text never change, so bake them together
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         overlay.fill(GAME_OVER_OVERLAY_COLOR)
-        surface.blit(overlay, (0, 0))
         game_over_text = FONT_LARGE.render("LOST IN SPACE!", True, GAME_OVER_TEXT_COLOR)
         text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 50))
-        surface.blit(game_over_text, text_rect)
+        overlay.blit(game_over_text, text_rect)
         restart_text = FONT_SMALL.render("Press R or Start to Restart", True, TEXT_COLOR)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 20))
-        surface.blit(restart_text, restart_rect)
+        overlay.blit(restart_text, restart_rect)
+        return overlay.convert_alpha()
 
     def draw_stage_transition(self, surface: pygame.Surface, text: str) -> None:
         text_render = FONT_LARGE.render(text, True, TEXT_COLOR)
@@ -433,8 +627,10 @@ class TetrisRenderer:
 # -------------------------
 class TetrisGameMerged:
     def __init__(self) -> None:
-        # board is GRID_HEIGHT rows by GRID_WIDTH cols
-        self.grid: List[List[Union[int, Tuple[int, int, int]]]] = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # board is GRID_HEIGHT rows by GRID_WIDTH cols; 0 = empty, otherwise VIBRANT_PASTELS index + 1
+        self.grid: List[List[int]] = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # occupancy of the same board as bitboard rows, used for collisions and line clears
+        self.rows: List[int] = [EMPTY_ROW] * GRID_HEIGHT
         self.current_piece: Optional[Tetromino] = None
         self.next_pieces: List[Tetromino] = []
         self.game_state = GameStateData()
@@ -443,13 +639,62 @@ class TetrisGameMerged:
         self.renderer = TetrisRenderer()
         self.sound_manager = SoundManager()
         self.joystick: Optional[pygame.joystick.Joystick] = None
-        self.last_movement_time = 0
-        self.last_axis_time = {"left": 0, "right": 0, "down": 0}
-        self.move_cooldown = MOVEMENT_COOLDOWN_MS
+        self.fall_time_ms = 0
+        self.fall_speed = STAGE_SPEEDS[0]
+        # auto-repeat for held keys and stick directions, driven by the sim steps
+        self._left_held = False
+        self._right_held = False
+        self._down_held = False
+        self._shift_dir = 0
+        self._das_timer = 0
+        self._down_timer = 0
+        # stick position per axis quantised to -1/0/1; only changes are dispatched
+        self._axis_state = {0: 0, 1: 0}
+        # moving things get the background restored where they were and are drawn where they are
+        self._prev_moving_rects: List[pygame.Rect] = []
+        self._sidebar_key: Optional[Tuple[int, int, int]] = None
+        self._full_redraw = True
+        # set once a presented frame carried the game-over overlay; the loop only idles after that
+        self._game_over_shown = False
+        self._running = False
+        self._dispatch = self._build_dispatch()
         self._init_joystick()
-        self._init_visuals()
         self.reset_game()
 
+    def _build_dispatch(self) -> Dict[int, Callable[[pygame.event.Event], None]]:
+        # event type -> bound handler, created once here rather than per event
+        return {
+            pygame.QUIT: self._quit,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.KEYUP: self._on_keyup,
+            pygame.JOYBUTTONDOWN: self._on_joybuttondown,
+            pygame.JOYAXISMOTION: self._on_joyaxismotion,
+            pygame.JOYHATMOTION: self._on_joyhatmotion,
+            pygame.VIDEOEXPOSE: self._on_videoexpose,
+        }
+
+    def _quit(self, event: pygame.event.Event) -> None:
+        self._running = False
+
+    def _on_keydown(self, event: pygame.event.Event) -> None:
+        self.handle_keydown(event.key)
+
+    def _on_keyup(self, event: pygame.event.Event) -> None:
+        self.handle_keyup(event.key)
+
+    def _on_joybuttondown(self, event: pygame.event.Event) -> None:
+        self.handle_joystick_button(event.button)
+
+    def _on_joyaxismotion(self, event: pygame.event.Event) -> None:
+        self.filter_joystick_axis(event.axis, event.value)
+
+    def _on_joyhatmotion(self, event: pygame.event.Event) -> None:
+        self.handle_hat(event.value)
+
+    def _on_videoexpose(self, event: pygame.event.Event) -> None:
+        # the window was uncovered or restored: repaint the background and sidebar text too
+        self._full_redraw = True
+
     def _init_joystick(self) -> None:
         if pygame.joystick.get_count() > 0:
             try:
@@ -463,25 +708,23 @@ class TetrisGameMerged:
             print("No controller found — using keyboard controls")
 
     def _init_visuals(self) -> None:
-        # initialize some stars and an empty particles list
-        for _ in range(STAR_COUNT):
-            self.effects.stars.append(ShootingStar(random.randint(0, FULL_WIDTH), random.randint(0, SCREEN_HEIGHT), random.choice(STAR_COLORS)))
-        self.effects.particles = []
+        # start with an empty particles list (the starfield is the renderer's scrolling layer)
+        self.effects.particles.clear()
 
     def reset_game(self) -> None:
         self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        self.rows = [EMPTY_ROW] * GRID_HEIGHT
         self.game_state = GameStateData()
         self.stage_info = StageInfo()
-        self.effects = VisualEffects(stars=[], particles=[])
-        self.renderer = TetrisRenderer()
+        self._full_redraw = True
+        self._game_over_shown = False
+        self.renderer.set_stage(0)
+        # the renderer and its sprite caches outlive a game; only clear the effects
+        self._init_visuals()
         self.next_pieces = [self._new_piece() for _ in range(MAX_STAGE + 1)]
         self.spawn_piece()
         # start background music if available
         self.sound_manager.play_music()
-
-        # re-init visuals
-        self._init_visuals()
-        self.last_movement_time = 0
         self.fall_time_ms = 0
         self.fall_speed = STAGE_SPEEDS[0]
 
@@ -489,9 +732,9 @@ class TetrisGameMerged:
         return min(MAX_STAGE, self.game_state.blocks_placed // BLOCKS_PER_STAGE)
 
     def _new_piece(self) -> Tetromino:
-        shape = random.choice(SHAPES)
+        shape_id = random.randrange(len(SHAPES))
         color = random.choice(VIBRANT_PASTELS)
-        return Tetromino(shape=[row[:] for row in shape], color=color, x=GRID_WIDTH // 2 - 1, y=-len(shape))
+        return Tetromino(shape_id=shape_id, rot=0, color=color, x=GRID_WIDTH // 2 - 1, y=-len(SHAPES[shape_id]))
 
     def spawn_piece(self) -> None:
         if self.game_state.game_over:
@@ -502,24 +745,29 @@ class TetrisGameMerged:
         if not self._is_valid_position(self.current_piece):
             self._handle_game_over()
 
-    def _is_valid_position(self, piece: Tetromino, dx: int = 0, dy: int = 0, shape: Optional[List[List[int]]] = None) -> bool:
-        if shape is None:
-            shape = piece.shape
-        for y_offset, row in enumerate(shape):
-            for x_offset, val in enumerate(row):
-                if val:
-                    x = piece.x + x_offset + dx
-                    y = piece.y + y_offset + dy
-                    if x < 0 or x >= GRID_WIDTH or y >= GRID_HEIGHT:
-                        return False
-                    if y >= 0 and self.grid[y][x] != 0:
-                        return False
+    def _is_valid_position(self, piece: Tetromino, dx: int = 0, dy: int = 0, rot: Optional[int] = None) -> bool:
+        if rot is None:
+            rot = piece.rot
+        # hot path (moves, gravity, ghost, hard drop): one AND per piece row against the
+        # bitboard; the walls are baked into every row and anything below the floor is solid
+        rows = self.rows
+        shift = piece.x + dx + BOARD_PAD
+        y = piece.y + dy
+        for bits in PIECE_BITS[piece.shape_id][rot]:
+            if 0 <= y < GRID_HEIGHT:
+                row = rows[y]
+            else:
+                row = EMPTY_ROW if y < 0 else FULL_ROW
+            if row & (bits << shift):
+                return False
+            y += 1
         return True
 
     def _lock_piece(self) -> None:
         piece = self.current_piece
         if piece is None:
             return
+        color_id = VIBRANT_PASTELS.index(piece.color) + 1
         for y_offset, row in enumerate(piece.shape):
             for x_offset, val in enumerate(row):
                 if val:
@@ -529,23 +777,26 @@ class TetrisGameMerged:
                         # locked above playing field -> game over
                         self._handle_game_over()
                         return
-                    self.grid[y][x] = piece.color
+                    self.grid[y][x] = color_id
+                    self.rows[y] |= 1 << (x + BOARD_PAD)
         # particles for landing
         self._spawn_block_land_particles(piece)
         self.game_state.blocks_placed += 1
+        self.renderer.set_stage(self.stage())
         # swap in next piece and check lines
         self.spawn_piece()
-        self._clear_lines()
+        self._clear_lines(piece.y, piece.y + len(piece.shape) - 1)
 
-    def _clear_lines(self) -> None:
-        lines = 0
-        for y in range(GRID_HEIGHT - 1, -1, -1):
-            if all(self.grid[y][x] != 0 for x in range(GRID_WIDTH)):
-                # remove row and insert empty at top
-                del self.grid[y]
-                self.grid.insert(0, [0 for _ in range(GRID_WIDTH)])
-                lines += 1
+    def _clear_lines(self, y_min: int, y_max: int) -> None:
+        # only rows the locked piece touched can have filled up (a full bitboard row is all ones)
+        full = [y for y in range(y_min, y_max + 1) if self.rows[y] == FULL_ROW]
+        lines = len(full)
         if lines > 0:
+            for y in reversed(full):
+                del self.grid[y]
+                del self.rows[y]
+            self.grid[:0] = [[0] * GRID_WIDTH for _ in range(lines)]
+            self.rows[:0] = [EMPTY_ROW] * lines
             self.game_state.lines += lines
             self.game_state.score += lines * 100
             self._spawn_line_clear_particles(lines)
@@ -572,17 +823,15 @@ class TetrisGameMerged:
     def _rotate_current(self) -> None:
         if not self.current_piece:
             return
-        shape = self.current_piece.shape
-        rotated = [list(row) for row in zip(*shape[::-1])]
-        if self._is_valid_position(self.current_piece, shape=rotated):
-            self.current_piece.shape = rotated
+        rotated = (self.current_piece.rot + 1) & 3
+        if self._is_valid_position(self.current_piece, rot=rotated):
+            self.current_piece.rot = rotated
             self.sound_manager.play("explosion")
 
     def _hard_drop(self) -> None:
         if not self.current_piece:
             return
-        while self._is_valid_position(self.current_piece, dy=1):
-            self.current_piece.y += 1
+        self.current_piece.y += self._drop_distance(self.current_piece)
         self.sound_manager.play("explosion")
         self._lock_piece()
 
@@ -602,25 +851,42 @@ class TetrisGameMerged:
     def _get_ghost_piece(self) -> Optional[Tetromino]:
         if not self.current_piece:
             return None
-        ghost = Tetromino(shape=[row[:] for row in self.current_piece.shape], color=self.current_piece.color, x=self.current_piece.x, y=self.current_piece.y)
-        while self._is_valid_position(ghost, dy=1):
-            ghost.y += 1
+        ghost = Tetromino(shape_id=self.current_piece.shape_id, rot=self.current_piece.rot, color=self.current_piece.color, x=self.current_piece.x, y=self.current_piece.y)
+        ghost.y += self._drop_distance(ghost)
         return ghost
 
+    def _drop_distance(self, piece: Tetromino) -> int:
+        # how far the piece can fall: walk each of its columns down the bitboard from the
+        # cell under its lowest block (tetromino columns have no gaps, so those cells land first)
+        rows = self.rows
+        distance = GRID_HEIGHT
+        for x_offset, bottom in PIECE_BOTTOMS[piece.shape_id][piece.rot]:
+            bit = 1 << (piece.x + x_offset + BOARD_PAD)
+            start = piece.y + bottom + 1
+            y = max(start, 0)
+            while y < GRID_HEIGHT and not rows[y] & bit:
+                y += 1
+            distance = min(distance, y - start)
+        return distance
+
     def _handle_game_over(self) -> None:
         self.game_state.game_over = True
         self.sound_manager.play("gameover")
-        pygame.mixer.music.stop()
+        self.sound_manager.stop_music()
 
     # -------------------------
     # Input handlers (keyboard + joystick)
     # -------------------------
     def handle_keydown(self, key: int) -> None:
         if key == pygame.K_LEFT:
-            self._move(-1, 0)
+            self._left_held = True
+            self._start_shift(-1)
         elif key == pygame.K_RIGHT:
-            self._move(1, 0)
+            self._right_held = True
+            self._start_shift(1)
         elif key == pygame.K_DOWN:
+            self._down_held = True
+            self._down_timer = 0
             self._move(0, 1)
         elif key == pygame.K_UP:
             self._rotate_current()
@@ -630,6 +896,46 @@ class TetrisGameMerged:
             if self.game_state.game_over:
                 self.reset_game()
 
+    def handle_keyup(self, key: int) -> None:
+        if key == pygame.K_DOWN:
+            self._down_held = False
+            return
+        if key == pygame.K_LEFT:
+            self._left_held = False
+        elif key == pygame.K_RIGHT:
+            self._right_held = False
+        else:
+            return
+        self._release_shift()
+
+    def _release_shift(self) -> None:
+        # fall back to a direction that is still held
+        if self._left_held:
+            self._start_shift(-1)
+        elif self._right_held:
+            self._start_shift(1)
+        else:
+            self._shift_dir = 0
+
+    def _start_shift(self, direction: int) -> None:
+        if direction != self._shift_dir:
+            self._shift_dir = direction
+            self._das_timer = 0
+            self._move(direction, 0)
+
+    def _auto_repeat(self, dt_ms: float) -> None:
+        # DAS/ARR for held keys, counted in frame time so the cadence does not depend on FPS
+        if self._shift_dir:
+            self._das_timer += dt_ms
+            while self._das_timer >= DAS_DELAY_MS:
+                self._move(self._shift_dir, 0)
+                self._das_timer -= ARR_MS
+        if self._down_held:
+            self._down_timer += dt_ms
+            while self._down_timer >= SOFT_DROP_MS:
+                self._move(0, 1)
+                self._down_timer -= SOFT_DROP_MS
+
     def handle_joystick_button(self, button: int) -> None:
         # restart on Start (common index 7)
         if self.game_state.game_over:
@@ -645,21 +951,34 @@ class TetrisGameMerged:
             if self.game_state.game_over:
                 self.reset_game()
 
-    def handle_joystick_axis(self, axis: int, value: float) -> None:
-        now = pygame.time.get_ticks()
+    def filter_joystick_axis(self, axis: int, value: float) -> None:
+        # sticks report every bit of jitter; react only when an axis crosses the threshold
+        if axis not in self._axis_state:
+            return
+        if abs(value) < AXIS_THRESHOLD:
+            quantised = 0
+        else:
+            quantised = 1 if value > 0 else -1
+        if self._axis_state[axis] != quantised:
+            self._axis_state[axis] = quantised
+            self.handle_joystick_axis(axis, quantised)
+
+    def handle_joystick_axis(self, axis: int, direction: int) -> None:
+        # a deflected stick is a held key: the same DAS/ARR and soft-drop repeat apply
         if axis == 0:
             # left / right
-            if value < -AXIS_THRESHOLD and now - self.last_axis_time["left"] > self.move_cooldown:
-                self._move(-1, 0)
-                self.last_axis_time["left"] = now
-            elif value > AXIS_THRESHOLD and now - self.last_axis_time["right"] > self.move_cooldown:
-                self._move(1, 0)
-                self.last_axis_time["right"] = now
+            if direction:
+                self._start_shift(direction)
+            else:
+                self._release_shift()
         elif axis == 1:
             # down (soft drop)
-            if value > AXIS_THRESHOLD and now - self.last_axis_time["down"] > self.move_cooldown:
+            if direction == 1:
+                self._down_held = True
+                self._down_timer = 0
                 self._move(0, 1)
-                self.last_axis_time["down"] = now
+            else:
+                self._down_held = False
 
     def handle_hat(self, hat_value: Tuple[int, int]) -> None:
         hx, hy = hat_value
@@ -673,30 +992,21 @@ class TetrisGameMerged:
     # -------------------------
     # Update & render loop
     # -------------------------
-    def update(self, dt_ms: int) -> None:
-        # update effects
-        for star in list(self.effects.stars):
-            star.update()
-            if star.life <= 0:
-                self.effects.stars.remove(star)
-        # maybe spawn a new star occasionally
-        if random.random() < STAR_SPAWN_CHANCE:
-            self.effects.stars.append(ShootingStar(random.randint(0, FULL_WIDTH), -10, random.choice(STAR_COLORS)))
-
-        for p in list(self.effects.particles):
-            p.update()
-            if p.life <= 0 or p.alpha <= 0:
-                try:
-                    self.effects.particles.remove(p)
-                except ValueError:
-                    pass
+    def _advance(self, steps: int) -> None:
+        # fixed sim steps: gravity, locking and held-key repeat
+        for _ in range(steps):
+            self.update(SIM_STEP_MS)
+            self._auto_repeat(SIM_STEP_MS)
+
+    def update_effects(self) -> None:
+        # particles animate per drawn frame, keeping only the survivors
+        self.effects.particles = [p for p in self.effects.particles if p.update_and_alive()]
 
+    def update(self, dt_ms: float) -> None:
         # update fall speed based on stage
         current_stage = self.stage()
         self.fall_speed = STAGE_SPEEDS[current_stage]
         # automatic falling: accumulate time
-        if not hasattr(self, 'fall_time_ms'):
-            self.fall_time_ms = 0
         self.fall_time_ms += dt_ms
         if self.fall_time_ms >= int(self.fall_speed * 1000):
             self.fall_time_ms = 0
@@ -708,84 +1018,149 @@ class TetrisGameMerged:
                     self._lock_piece()
 
     def draw(self, surface: pygame.Surface) -> None:
+        # the playfield and preview column are redrawn every frame; elsewhere only what moved
+        # (particles) or changed (sidebar text) gets the background put back and redrawn
+        restore = [PLAYFIELD_RECT, PREVIEW_REGION_RECT] + self._prev_moving_rects
+        sidebar_key = (self.game_state.score, self.game_state.lines, self.stage())
+        redraw_text = (self._full_redraw or sidebar_key != self._sidebar_key
+                       or SIDEBAR_INFO_RECT.collidelist(self._prev_moving_rects) != -1)
+        if redraw_text:
+            restore.append(SIDEBAR_INFO_RECT)
+
         # background & starfield
-        self.renderer.draw_galaxy_background(surface)
-        for star in self.effects.stars:
-            star.draw(surface)
+        if self._full_redraw:
+            self.renderer.draw_galaxy_background(surface)
+        else:
+            self.renderer.restore_background(surface, restore)
+        self.renderer.draw_star_layer(surface)
 
-        # playfield surface
-        play_surf = pygame.Surface((GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE), pygame.SRCALPHA)
-        self.renderer.draw_grid(play_surf, self.grid)
+        # playfield: drawn straight onto the screen, whose background was just restored, so
+        # there is no intermediate layer to clear and composite every frame
+        self.renderer.draw_grid(surface, self.grid, self.rows)
 
         # ghost piece
         ghost = self._get_ghost_piece()
         if ghost:
-            self.renderer.draw_piece(play_surf, ghost, is_ghost=True)
+            self.renderer.draw_piece(surface, ghost, is_ghost=True)
 
         # current piece
         if self.current_piece:
-            self.renderer.draw_piece(play_surf, self.current_piece, is_ghost=False)
-
-        # blit playfield
-        surface.blit(play_surf, (0, 0))
+            self.renderer.draw_piece(surface, self.current_piece, is_ghost=False)
 
         # next previews & UI on sidebar
-        self.renderer.draw_next_pieces(surface, self.next_pieces, self.stage())
-        self.renderer.draw_sidebar(surface, self.game_state.score, self.game_state.lines, self.stage())
-
-        # draw particles on top
+        self.renderer.draw_next_pieces(surface, self.next_pieces)
+        if redraw_text:
+            self.renderer.draw_sidebar(surface, *sidebar_key)
+            self._sidebar_key = sidebar_key
+
+        # draw particles on top, all in one blits() call
+        particle_blits = []
+        moving = []
         for p in self.effects.particles:
-            p.draw(surface)
+            particle_blits.extend(p.sprites(self.renderer))
+            moving.append(p.rect().clip(SCREEN_RECT))
+        surface.blits(particle_blits, doreturn=False)
 
         # Game over overlay
         if self.game_state.game_over:
             self.renderer.draw_game_over(surface)
 
+        self._prev_moving_rects = moving
+
     # -------------------------
     # Main run loop
     # -------------------------
+    def _open_display(self) -> pygame.Surface:
+        # nearest-neighbour scaling keeps the blocks crisp; vsync stops tearing where the driver allows it
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "0")
+        try:
+            return pygame.display.set_mode((FULL_WIDTH, SCREEN_HEIGHT), DISPLAY_FLAGS, vsync=1)
+        except pygame.error as err:
+            print("VSync unavailable, using timed frames only:", err)
+            return pygame.display.set_mode((FULL_WIDTH, SCREEN_HEIGHT), DISPLAY_FLAGS)
+
     def run(self) -> None:
-        clock = pygame.time.Clock()
-        screen = pygame.display.set_mode((FULL_WIDTH, SCREEN_HEIGHT))
+        screen = self._open_display()
         pygame.display.set_caption("Galaxy Tetris (Controller + Pastel Theme)")
-
-        running = True
-        while running:
-            dt_ms = clock.tick(FPS)
+        self.renderer.build_caches()
+        # only the events the loop handles are queued at all; SDL drops the rest
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.JOYBUTTONDOWN,
+                                  pygame.JOYAXISMOTION, pygame.JOYHATMOTION, pygame.VIDEOEXPOSE])
+
+        # bind what the loop touches every frame to locals
+        get_events = pygame.event.get
+        wait_event = pygame.event.wait
+        dispatch = self._dispatch
+
+        # fixed-timestep loop: input is polled and the world stepped at SIM_HZ, frames drawn at FPS
+        perf_counter = time.perf_counter
+        sim_step = SIM_STEP_MS / 1000
+        frame_time = 1 / FPS
+        previous = perf_counter()
+        next_frame = previous
+        accumulator = 0.0
+        # the OS wakes us late by a fairly steady amount; learn it and sleep that much less
+        oversleeps: deque = deque(maxlen=PACING_WINDOW)
+        oversleep_total = 0.0
+        predicted_oversleep = 0.0
+
+        self._running = True
+        while self._running:
+            if self._game_over_shown and not self._full_redraw:
+                # nothing moves behind the game-over screen once it is shown: let the process
+                # sleep inside SDL until input arrives instead of ticking at full rate
+                event = wait_event(GAME_OVER_WAIT_MS)
+                handler = dispatch.get(event.type)
+                if handler is not None:
+                    handler(event)
+                previous = next_frame = perf_counter()
+                continue
+            now = perf_counter()
+            accumulator = min(accumulator + now - previous, MAX_CATCH_UP_MS / 1000)
+            previous = now
             # event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    self.handle_keydown(event.key)
-                elif event.type == pygame.JOYBUTTONDOWN:
-                    self.handle_joystick_button(event.button)
-                elif event.type == pygame.JOYAXISMOTION:
-                    self.handle_joystick_axis(event.axis, event.value)
-                elif event.type == pygame.JOYHATMOTION:
-                    self.handle_hat(event.value)
-            # also support keyboard holding for smooth movement based on real time
-            keys = pygame.key.get_pressed()
-            now = pygame.time.get_ticks()
-            if keys[pygame.K_LEFT] and now - self.last_movement_time > self.move_cooldown:
-                self._move(-1, 0)
-                self.last_movement_time = now
-            if keys[pygame.K_RIGHT] and now - self.last_movement_time > self.move_cooldown:
-                self._move(1, 0)
-                self.last_movement_time = now
-            if keys[pygame.K_DOWN] and now - self.last_movement_time > self.move_cooldown:
-                self._move(0, 1)
-                self.last_movement_time = now
-
-            # update world
-            self.update(dt_ms)
+            for event in get_events():
+                handler = dispatch.get(event.type)
+                if handler is not None:
+                    handler(event)
+            # whole sim steps due since the last pass (world update + held-key repeat)
+            steps = int(accumulator // sim_step)
+            accumulator -= steps * sim_step
+            self._advance(steps)
             # draw
-            screen.fill((0, 0, 0))
-            self.draw(screen)
-            pygame.display.flip()
-
-        pygame.quit()
-        sys.exit()
+            if now >= next_frame:
+                self.update_effects()
+                self.draw(screen)
+                pygame.display.flip()
+                self._full_redraw = False
+                # only idle on game over once the overlay has actually been presented
+                self._game_over_shown = self.game_state.game_over
+                next_frame += frame_time
+                if next_frame < now:
+                    # fell behind (window drag, slow frame): resync instead of bursting frames
+                    next_frame = now + frame_time
+            else:
+                # only frame deadlines are worth burning CPU for; a late sim step is absorbed
+                # by the accumulator on the next pass
+                step_due = now + sim_step - accumulator
+                spin = next_frame <= step_due
+                deadline = next_frame if spin else step_due
+                # timed from just before the sleep, so the window learns timer slop and not this
+                # pass's sim and sound work
+                sleep_start = perf_counter()
+                wanted = deadline - sleep_start - predicted_oversleep - (SPIN_MARGIN_S if spin else 0.0)
+                if wanted > 0:
+                    time.sleep(wanted)
+                    if len(oversleeps) == oversleeps.maxlen:
+                        oversleep_total -= oversleeps[0]
+                    overshoot = perf_counter() - sleep_start - wanted
+                    oversleeps.append(overshoot)
+                    oversleep_total += overshoot
+                    predicted_oversleep = min(max(oversleep_total / len(oversleeps), 0.0), sim_step)
+                if spin:
+                    while perf_counter() < deadline:
+                        pass
 
 # -------------------------
 # Run game if main